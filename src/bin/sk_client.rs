@@ -1,8 +1,11 @@
-use serde::{Deserialize, Serialize};
+use serde::{de::DeserializeOwned, Deserialize, Serialize};
 use std::collections::HashMap;
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader, Read, Write};
 use std::net::TcpStream;
-use std::time::Instant;
+#[cfg(unix)]
+use std::os::unix::net::UnixStream;
+use std::sync::Barrier;
+use std::time::{Duration, Instant};
 
 #[derive(Debug, Serialize)]
 struct EvalRequest {
@@ -22,20 +25,31 @@ struct EvalResponse {
     request_id: u64,
 }
 
+/// The response fields the benchmark reads. Leaving out `result` lets serde
+/// skip over it instead of building a serde_json::Value for every response.
+#[derive(Debug, Deserialize)]
+struct BenchResponse {
+    success: bool,
+    error: Option<String>,
+    execution_time_ms: f64,
+}
+
 fn main() {
     let args: Vec<String> = std::env::args().collect();
     
     if args.len() < 3 {
         eprintln!("Usage: sk_client <host:port> <expression> [var=value ...]");
         eprintln!("       sk_client <host:port> <expression> --json '{{\"var\": \"value\"}}'");
-        eprintln!("       sk_client <host:port> --benchmark <expression> [iterations]");
+        eprintln!("       sk_client <host:port> --benchmark <expression> [iterations] [--concurrency N]");
         eprintln!("");
         eprintln!("Examples:");
         eprintln!("  sk_client localhost:8080 '=2 + 3 * 4'");
         eprintln!("  sk_client localhost:8080 '=SUM(:sales, :bonus)' sales=1000 bonus=500");
         eprintln!("  sk_client localhost:8080 '=:user.name' --json '{{\"user\": {{\"name\": \"Alice\"}}}}'");
         eprintln!("  sk_client localhost:8080 --benchmark '=2+3*4' 1000");
+        eprintln!("  sk_client localhost:8080 --benchmark '=2+3*4' 10000 --concurrency 8");
         eprintln!("  sk_client localhost:8080 '=2+3' --token <secret>");
+        eprintln!("  sk_client unix:/tmp/sk_server.sock '=2+3'");
         std::process::exit(1);
     }
     
@@ -43,13 +57,14 @@ fn main() {
     
     // Check for benchmark mode
     if args.len() > 3 && args[2] == "--benchmark" {
-        // Parse benchmark options: expression [--json JSON] [var=val ...] [--output-json] [--token TOKEN] [iterations]
+        // Parse benchmark options: expression [--json JSON] [var=val ...] [--output-json] [--concurrency N] [--token TOKEN] [iterations]
         let expression = args[3].clone();
         let mut variables = HashMap::new();
         let mut json_input: Option<String> = None;
         let mut output_json = false;
         let mut token: Option<String> = std::env::var("SKILLET_SERVER_TOKEN").ok();
         let mut iterations: usize = 100;
+        let mut concurrency: usize = 1;
 
         let mut i = 4;
         while i < args.len() {
@@ -60,6 +75,10 @@ fn main() {
                 i += 1;
             } else if arg == "--output-json" {
                 output_json = true;
+            } else if arg == "--concurrency" || arg == "-c" {
+                if i + 1 >= args.len() { eprintln!("Error: --concurrency flag requires a number"); std::process::exit(1); }
+                concurrency = args[i + 1].parse().unwrap_or_else(|_| { eprintln!("Error: Invalid concurrency value"); std::process::exit(1); });
+                i += 1;
             } else if arg == "--token" {
                 if i + 1 >= args.len() { eprintln!("Error: --token flag requires a value"); std::process::exit(1); }
                 token = Some(args[i + 1].clone());
@@ -89,7 +108,7 @@ fn main() {
             EvalRequest { expression, variables: None, output_json: Some(output_json), token }
         };
 
-        run_benchmark_with_request(server_addr, request, iterations);
+        run_benchmark_with_request(server_addr, request, iterations, concurrency);
         return;
     }
     
@@ -184,110 +203,237 @@ fn main() {
     }
 }
 
+/// How long a benchmark connection waits for a response before giving up
+const READ_TIMEOUT: Duration = Duration::from_secs(10);
+
+/// A read timed out: the server accepted the connection but never answered
+#[derive(Debug)]
+struct NoResponse(Duration);
+
+impl std::fmt::Display for NoResponse {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        write!(f, "No response within {}s", self.0.as_secs())
+    }
+}
+
+impl std::error::Error for NoResponse {}
+
+/// Persistent connection to a Skillet server.
+/// The server answers any number of newline-delimited requests on one socket,
+/// so callers reuse the connection instead of paying a TCP handshake per request.
+/// The socket is opened lazily and dropped on any I/O error so the next
+/// request reconnects. An address of the form `unix:<path>` connects to the
+/// server's Unix domain socket instead of TCP.
+struct Connection {
+    server_addr: String,
+    stream: Option<(Box<dyn Write>, BufReader<Box<dyn Read>>)>,
+    response_buf: Vec<u8>,
+    read_timeout: Option<Duration>,
+}
+
+impl Connection {
+    fn new(server_addr: &str) -> Self {
+        Self {
+            server_addr: server_addr.to_string(),
+            stream: None,
+            response_buf: Vec::new(),
+            read_timeout: None,
+        }
+    }
+
+    /// A connection whose reads fail with `NoResponse` after `timeout`
+    /// instead of blocking until the server answers
+    fn with_read_timeout(server_addr: &str, timeout: Duration) -> Self {
+        Self { read_timeout: Some(timeout), ..Self::new(server_addr) }
+    }
+
+    /// Serializes a request into its newline-terminated wire form, so a
+    /// request sent repeatedly only has to be encoded once
+    fn prepare(request: &EvalRequest) -> Result<Vec<u8>, serde_json::Error> {
+        let mut payload = serde_json::to_vec(request)?;
+        payload.push(b'\n');
+        Ok(payload)
+    }
+
+    fn send<R: DeserializeOwned>(&mut self, request: &EvalRequest) -> Result<R, Box<dyn std::error::Error>> {
+        let payload = Self::prepare(request)?;
+        self.send_prepared(&payload)
+    }
+
+    fn send_prepared<R: DeserializeOwned>(&mut self, payload: &[u8]) -> Result<R, Box<dyn std::error::Error>> {
+        let result = self.try_send(payload);
+        if result.is_err() {
+            self.stream = None;
+        }
+        result
+    }
+
+    /// Opens the socket if it isn't open yet
+    fn connect(&mut self) -> std::io::Result<()> {
+        if self.stream.is_some() {
+            return Ok(());
+        }
+        let (writer, reader): (Box<dyn Write>, Box<dyn Read>) =
+            if let Some(path) = self.server_addr.strip_prefix("unix:") {
+                connect_unix(path, self.read_timeout)?
+            } else {
+                let stream = TcpStream::connect(&self.server_addr)?;
+                // Requests are small; don't let Nagle hold them back waiting for an ACK
+                stream.set_nodelay(true)?;
+                stream.set_read_timeout(self.read_timeout)?;
+                (Box::new(stream.try_clone()?), Box::new(stream))
+            };
+        self.stream = Some((writer, BufReader::new(reader)));
+        Ok(())
+    }
+
+    fn try_send<R: DeserializeOwned>(&mut self, payload: &[u8]) -> Result<R, Box<dyn std::error::Error>> {
+        self.connect()?;
+        let (stream, reader) = self.stream.as_mut().unwrap();
+
+        // Send the whole line in a single write
+        stream.write_all(payload)?;
+
+        self.response_buf.clear();
+        match reader.read_until(b'\n', &mut self.response_buf) {
+            Ok(0) => return Err("Server closed the connection".into()),
+            Ok(_) => {}
+            // Timed-out reads surface as WouldBlock on Unix and TimedOut on Windows
+            Err(e) if matches!(e.kind(), std::io::ErrorKind::WouldBlock | std::io::ErrorKind::TimedOut) => {
+                return Err(Box::new(NoResponse(self.read_timeout.unwrap_or_default())));
+            }
+            Err(e) => return Err(e.into()),
+        }
+
+        let response = serde_json::from_slice(&self.response_buf)?;
+        Ok(response)
+    }
+}
+
+#[cfg(unix)]
+fn connect_unix(path: &str, read_timeout: Option<Duration>) -> std::io::Result<(Box<dyn Write>, Box<dyn Read>)> {
+    let stream = UnixStream::connect(path)?;
+    stream.set_read_timeout(read_timeout)?;
+    Ok((Box::new(stream.try_clone()?), Box::new(stream)))
+}
+
+#[cfg(not(unix))]
+fn connect_unix(_path: &str, _read_timeout: Option<Duration>) -> std::io::Result<(Box<dyn Write>, Box<dyn Read>)> {
+    Err(std::io::Error::new(
+        std::io::ErrorKind::Unsupported,
+        "Unix domain sockets are not supported on this platform",
+    ))
+}
+
 fn send_request(server_addr: &str, request: &EvalRequest) -> Result<EvalResponse, Box<dyn std::error::Error>> {
-    let mut stream = TcpStream::connect(server_addr)?;
-    
-    let request_json = serde_json::to_string(request)?;
-    writeln!(stream, "{}", request_json)?;
-    
-    let mut reader = BufReader::new(stream);
-    let mut response_line = String::new();
-    reader.read_line(&mut response_line)?;
-    
-    let response: EvalResponse = serde_json::from_str(&response_line)?;
-    Ok(response)
+    Connection::new(server_addr).send(request)
 }
 
-fn run_benchmark_with_request(server_addr: &str, request: EvalRequest, iterations: usize) {
+fn run_benchmark_with_request(server_addr: &str, request: EvalRequest, iterations: usize, concurrency: usize) {
+    let concurrency = concurrency.clamp(1, iterations.max(1));
+    
     println!("🚀 Benchmarking Skillet Server Performance");
     println!("==========================================");
     println!("Server: {}", server_addr);
     println!("Expression: {}", request.expression);
     println!("Iterations: {}", iterations);
+    println!("Concurrency: {}", concurrency);
     println!("");
     
+    // sk_server serves each connection on one of its worker threads for as
+    // long as the connection stays open, so connections beyond its thread
+    // count wait for a free thread. The client can't see that count; say so
+    if concurrency > 1 {
+        eprintln!("Note: sk_server holds one worker thread per open connection, and this client");
+        eprintln!("      cannot tell how many threads the server has (default: its CPU count).");
+        eprintln!("      Start it with at least {} threads, e.g. sk_server <port> {};", concurrency, concurrency);
+        eprintln!("      connections it cannot serve are reported as not served.");
+        eprintln!("");
+    }
+    
+    let mut conn = Connection::with_read_timeout(server_addr, READ_TIMEOUT);
+    // Every iteration sends the same request; encode it once up front
+    let payload = Connection::prepare(&request).unwrap_or_else(|e| {
+        eprintln!("Error: Failed to serialize request: {}", e);
+        std::process::exit(1);
+    });
+
     // Warmup
     print!("Warming up...");
     std::io::stdout().flush().unwrap();
     for _ in 0..10 {
-        if let Err(e) = send_request(server_addr, &request) {
+        if let Err(e) = conn.send_prepared::<BenchResponse>(&payload) {
             eprintln!("\nWarmup failed: {}", e);
             std::process::exit(1);
         }
     }
+    drop(conn);
     println!(" Done!");
     
-    // Benchmark
+    // Benchmark: each worker thread owns one persistent connection and
+    // runs its share of the iterations, so with concurrency > 1 the
+    // server sees that many requests in flight at once
     println!("Running benchmark...");
-    let mut durations = Vec::new();
-    let mut server_times = Vec::new();
-    let mut successful = 0;
-    let mut failed = 0;
     
-    let total_start = Instant::now();
-    
-    for i in 0..iterations {
-        if i % (iterations / 10).max(1) == 0 {
-            print!(".");
-            std::io::stdout().flush().unwrap();
-        }
+    let barrier = Barrier::new(concurrency + 1);
+    let (results, total_duration) = std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..concurrency).map(|worker| {
+            let barrier = &barrier;
+            let payload = &payload[..];
+            let worker_iterations = iterations / concurrency + usize::from(worker < iterations % concurrency);
+            // Progress dots only for long runs; in short runs the flushed stdout
+            // writes would be a noticeable share of the time being measured
+            let progress_step = if worker == 0 && iterations >= 1000 { (worker_iterations / 10).max(1) } else { 0 };
+            scope.spawn(move || {
+                let mut conn = Connection::with_read_timeout(server_addr, READ_TIMEOUT);
+                // Connect before the clock starts so handshakes aren't timed.
+                // Only connect: a request here could wait forever for a
+                // server thread that is held by a worker already at the barrier
+                let _ = conn.connect();
+                barrier.wait();
+                run_worker(&mut conn, payload, worker, concurrency, worker_iterations, progress_step)
+            })
+        }).collect();
         
-        let start = Instant::now();
-        match send_request(server_addr, &request) {
-            Ok(response) => {
-                let duration = start.elapsed();
-                durations.push(duration.as_millis() as f64);
-                server_times.push(response.execution_time_ms);
-                
-                if response.success {
-                    successful += 1;
-                } else {
-                    failed += 1;
-                    if failed <= 5 { // Show first few errors
-                        eprintln!("\nError in iteration {}: {}", i, response.error.unwrap_or_else(|| "Unknown".to_string()));
-                    }
-                }
-            }
-            Err(e) => {
-                failed += 1;
-                if failed <= 5 {
-                    eprintln!("\nConnection error in iteration {}: {}", i, e);
-                }
-                durations.push(f64::MAX); // Mark as failed
-                server_times.push(0.0);
-            }
-        }
-    }
-    
-    let total_duration = total_start.elapsed();
+        barrier.wait();
+        let total_start = Instant::now();
+        let results: Vec<WorkerResult> = handles.into_iter().map(|h| h.join().unwrap()).collect();
+        // Measure up to the last answered request, not the last timeout
+        let total_end = results.iter().filter_map(|r| r.finished).max().unwrap_or(total_start);
+        (results, total_end.duration_since(total_start))
+    });
     println!(" Done!");
     
+    let mut durations = Vec::with_capacity(iterations);
+    let mut server_times = Vec::with_capacity(iterations);
+    let mut successful = 0;
+    let mut failed = 0;
+    let mut not_served = 0;
+    let mut stopped_workers = 0;
+    for result in results {
+        durations.extend(result.durations);
+        server_times.extend(result.server_times);
+        successful += result.successful;
+        failed += result.failed;
+        not_served += result.not_served;
+        stopped_workers += usize::from(result.not_served > 0);
+    }
+    
     // Calculate statistics
-    let valid_durations: Vec<f64> = durations.iter().filter(|&&d| d != f64::MAX).cloned().collect();
-    let valid_server_times: Vec<f64> = server_times.iter().filter(|&&t| t > 0.0).cloned().collect();
+    let mut valid_durations = durations;
+    let mut valid_server_times: Vec<f64> = server_times.into_iter().filter(|&t| t > 0.0).collect();
     
     if valid_durations.is_empty() {
         eprintln!("All requests failed!");
         std::process::exit(1);
     }
     
-    let avg_client_time = valid_durations.iter().sum::<f64>() / valid_durations.len() as f64;
-    let avg_server_time = valid_server_times.iter().sum::<f64>() / valid_server_times.len() as f64;
-    let min_client_time = valid_durations.iter().fold(f64::MAX, |a, &b| a.min(b));
-    let max_client_time = valid_durations.iter().fold(0.0f64, |a, &b| a.max(b));
-    let min_server_time = valid_server_times.iter().fold(f64::MAX, |a, &b| a.min(b));
-    let max_server_time = valid_server_times.iter().fold(0.0f64, |a, &b| a.max(b));
+    let client = LatencyStats::from_samples(&mut valid_durations);
+    let server = LatencyStats::from_samples(&mut valid_server_times);
     
     let throughput = successful as f64 / total_duration.as_secs_f64();
     let success_rate = successful as f64 / iterations as f64 * 100.0;
     
-    // Calculate percentiles
-    let mut sorted_durations = valid_durations.clone();
-    sorted_durations.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let p50 = percentile(&sorted_durations, 50.0);
-    let p95 = percentile(&sorted_durations, 95.0);
-    let p99 = percentile(&sorted_durations, 99.0);
-    
     // Results
     println!("");
     println!("📊 BENCHMARK RESULTS");
@@ -295,34 +441,30 @@ fn run_benchmark_with_request(server_addr: &str, request: EvalRequest, iteration
     println!("Total requests: {}", iterations);
     println!("Successful: {}", successful);
     println!("Failed: {}", failed);
+    if not_served > 0 {
+        println!("Not served: {} ({} of {} connection(s) stopped)", not_served, stopped_workers, concurrency);
+    }
     println!("Success rate: {:.2}%", success_rate);
     println!("Total time: {:.2}s", total_duration.as_secs_f64());
-    println!("Throughput: {:.1} requests/second", throughput);
+    println!("Throughput: {:.1} requests/second ({} concurrent connection(s))", throughput, concurrency);
     println!("");
     println!("Client-side latency (includes network):");
-    println!("  Average: {:.2}ms", avg_client_time);
-    println!("  Min: {:.2}ms", min_client_time);
-    println!("  Max: {:.2}ms", max_client_time);
-    println!("  P50: {:.2}ms", p50);
-    println!("  P95: {:.2}ms", p95);
-    println!("  P99: {:.2}ms", p99);
+    client.print();
     println!("");
     println!("Server-side execution time:");
-    println!("  Average: {:.2}ms", avg_server_time);
-    println!("  Min: {:.2}ms", min_server_time);
-    println!("  Max: {:.2}ms", max_server_time);
+    server.print();
     println!("");
-    println!("Network overhead: {:.2}ms average", avg_client_time - avg_server_time);
+    println!("Network overhead: {:.2}ms average", client.avg - server.avg);
     
     // Performance comparison
-    let improvement_factor = 250.0 / avg_server_time; // vs original 0.25s per operation
+    let improvement_factor = 250.0 / server.avg; // vs original 0.25s per operation
     println!("");
     println!("🎯 PERFORMANCE IMPROVEMENT");
     println!("==========================");
     println!("Original sk command: ~250ms per operation");
-    println!("Server mode: {:.2}ms per operation", avg_server_time);
+    println!("Server mode: {:.2}ms per operation", server.avg);
     println!("Improvement: {:.1}x faster", improvement_factor);
-    println!("Estimated max throughput: {:.0} ops/second", 1000.0 / avg_server_time);
+    println!("Estimated max throughput: {:.0} ops/second", 1000.0 / server.avg);
 }
 
 
@@ -345,6 +487,142 @@ fn parse_value_to_json(s: &str) -> serde_json::Value {
     }
 }
 
+/// Timings collected by one benchmark worker over its own connection
+struct WorkerResult {
+    durations: Vec<f64>,
+    server_times: Vec<f64>,
+    successful: usize,
+    failed: usize,
+    /// Iterations never answered because the connection broke or timed out
+    not_served: usize,
+    /// When the worker's last answered request completed
+    finished: Option<Instant>,
+}
+
+fn run_worker(
+    conn: &mut Connection,
+    payload: &[u8],
+    worker: usize,
+    concurrency: usize,
+    iterations: usize,
+    progress_step: usize,
+) -> WorkerResult {
+    let mut result = WorkerResult {
+        durations: Vec::with_capacity(iterations),
+        server_times: Vec::with_capacity(iterations),
+        successful: 0,
+        failed: 0,
+        not_served: 0,
+        finished: None,
+    };
+    
+    for n in 0..iterations {
+        if progress_step > 0 && n % progress_step == 0 {
+            print!(".");
+            std::io::stdout().flush().unwrap();
+        }
+        // Iteration number across all workers, for error messages
+        let i = n * concurrency + worker;
+        
+        let start = Instant::now();
+        match conn.send_prepared::<BenchResponse>(payload) {
+            Ok(response) => {
+                result.finished = Some(Instant::now());
+                let duration = start.elapsed();
+                // Keep sub-millisecond precision; as_millis() truncated fast requests to 0
+                result.durations.push(duration.as_secs_f64() * 1000.0);
+                result.server_times.push(response.execution_time_ms);
+                
+                if response.success {
+                    result.successful += 1;
+                } else {
+                    result.failed += 1;
+                    if result.failed <= 5 { // Show first few errors
+                        eprintln!("\nError in iteration {}: {}", i, response.error.unwrap_or_else(|| "Unknown".to_string()));
+                    }
+                }
+            }
+            Err(e) => {
+                // Stop instead of reconnecting: a new connection would only
+                // queue behind the busy server threads again, and time spent
+                // waiting for one is not request latency
+                result.not_served = iterations - n;
+                eprintln!("\nConnection error in iteration {}: {} (worker {} stopped)", i, e, worker);
+                break;
+            }
+        }
+    }
+    
+    result
+}
+
+/// Summary of a set of latency samples, in milliseconds
+struct LatencyStats {
+    avg: f64,
+    trimmed_avg: f64,
+    geo_mean: f64,
+    std_dev: f64,
+    min: f64,
+    max: f64,
+    p50: f64,
+    p95: f64,
+    p99: f64,
+}
+
+impl LatencyStats {
+    /// Sorts the samples once; min, max and percentiles are then read
+    /// directly from the sorted slice, and the means and standard deviation
+    /// are accumulated in a single pass over it.
+    fn from_samples(samples: &mut [f64]) -> Self {
+        if samples.is_empty() {
+            return Self {
+                avg: 0.0, trimmed_avg: 0.0, geo_mean: 0.0, std_dev: 0.0,
+                min: 0.0, max: 0.0, p50: 0.0, p95: 0.0, p99: 0.0,
+            };
+        }
+        samples.sort_by(|a, b| a.total_cmp(b));
+
+        // Trimmed mean drops the fastest and slowest 5% of samples
+        let n = samples.len();
+        let trim = n * 5 / 100;
+        let (mut sum, mut sum_sq, mut sum_ln, mut trimmed_sum) = (0.0, 0.0, 0.0, 0.0);
+        for (i, &x) in samples.iter().enumerate() {
+            sum += x;
+            sum_sq += x * x;
+            sum_ln += x.ln();
+            if i >= trim && i < n - trim {
+                trimmed_sum += x;
+            }
+        }
+        let avg = sum / n as f64;
+        let variance = (sum_sq / n as f64 - avg * avg).max(0.0);
+
+        Self {
+            avg,
+            trimmed_avg: trimmed_sum / (n - 2 * trim) as f64,
+            geo_mean: (sum_ln / n as f64).exp(),
+            std_dev: variance.sqrt(),
+            min: samples[0],
+            max: samples[samples.len() - 1],
+            p50: percentile(samples, 50.0),
+            p95: percentile(samples, 95.0),
+            p99: percentile(samples, 99.0),
+        }
+    }
+
+    fn print(&self) {
+        println!("  Average: {:.2}ms", self.avg);
+        println!("  Trimmed average (5%): {:.2}ms", self.trimmed_avg);
+        println!("  Geometric mean: {:.2}ms", self.geo_mean);
+        println!("  Std dev: {:.2}ms", self.std_dev);
+        println!("  Min: {:.2}ms", self.min);
+        println!("  Max: {:.2}ms", self.max);
+        println!("  P50: {:.2}ms", self.p50);
+        println!("  P95: {:.2}ms", self.p95);
+        println!("  P99: {:.2}ms", self.p99);
+    }
+}
+
 fn percentile(sorted_data: &[f64], p: f64) -> f64 {
     let index = (p / 100.0 * (sorted_data.len() - 1) as f64) as usize;
     sorted_data[index.min(sorted_data.len() - 1)]
@@ -149,12 +149,17 @@ fn check_server_health(config: &BenchConfig) -> bool {
 }
 
 fn make_request(host: &str, port: u16, request: &str) -> Result<String, std::io::Error> {
+    let formatted_request = request.replace("{}", host);
+    send_raw_request(host, port, &formatted_request)
+}
+
+/// Sends an already formatted HTTP request and reads the full response
+fn send_raw_request(host: &str, port: u16, request: &str) -> Result<String, std::io::Error> {
     let mut stream = TcpStream::connect((host, port))?;
     stream.set_read_timeout(Some(Duration::from_secs(10)))?;
     stream.set_write_timeout(Some(Duration::from_secs(5)))?;
     
-    let formatted_request = request.replace("{}", host);
-    stream.write_all(formatted_request.as_bytes())?;
+    stream.write_all(request.as_bytes())?;
     
     let mut response = String::new();
     stream.read_to_string(&mut response)?;
@@ -188,8 +193,9 @@ fn run_warmup(config: &BenchConfig) {
     for _ in 0..concurrent {
         let config = config.clone();
         let handle = thread::spawn(move || {
+            let request = build_eval_request(&config.host, "2+2");
             for _ in 0..requests_per_thread {
-                let _ = make_eval_request(&config.host, config.port, "2+2");
+                let _ = send_raw_request(&config.host, config.port, &request);
                 thread::sleep(Duration::from_millis(10));
             }
         });
@@ -220,10 +226,11 @@ fn run_expression_tests(config: &BenchConfig) {
         let _start = Instant::now();
         let mut success_count = 0;
         let mut latencies = Vec::new();
+        let request = build_eval_request(&config.host, test_case.expression);
         
         for _ in 0..10 {
             let req_start = Instant::now();
-            match make_eval_request(&config.host, config.port, test_case.expression) {
+            match send_raw_request(&config.host, config.port, &request) {
                 Ok(response) if response.contains("\"success\":true") => {
                     latencies.push(req_start.elapsed());
                     success_count += 1;
@@ -324,7 +331,9 @@ fn run_concurrent_benchmark(config: &BenchConfig, concurrent: usize, expression:
     
     let success_count = Arc::new(AtomicU64::new(0));
     let error_count = Arc::new(AtomicU64::new(0));
-    let latencies = Arc::new(std::sync::Mutex::new(Vec::new()));
+    
+    // The request is identical for every iteration, so encode it once
+    let request = Arc::new(build_eval_request(&config.host, expression));
     
     let start_time = Instant::now();
     let mut handles = Vec::new();
@@ -337,18 +346,18 @@ fn run_concurrent_benchmark(config: &BenchConfig, concurrent: usize, expression:
         };
         
         let config = config.clone();
-        let expression = expression.to_string();
+        let request = Arc::clone(&request);
         let success_count = Arc::clone(&success_count);
         let error_count = Arc::clone(&error_count);
-        let latencies = Arc::clone(&latencies);
         
+        // Each worker collects its own latencies; they are merged after join
         let handle = thread::spawn(move || {
+            let mut latencies = Vec::with_capacity(requests);
             for _ in 0..requests {
                 let req_start = Instant::now();
-                match make_eval_request(&config.host, config.port, &expression) {
+                match send_raw_request(&config.host, config.port, &request) {
                     Ok(response) if response.contains("\"success\":true") => {
-                        let latency = req_start.elapsed();
-                        latencies.lock().unwrap().push(latency);
+                        latencies.push(req_start.elapsed());
                         success_count.fetch_add(1, Ordering::Relaxed);
                     }
                     _ => {
@@ -356,19 +365,20 @@ fn run_concurrent_benchmark(config: &BenchConfig, concurrent: usize, expression:
                     }
                 }
             }
+            latencies
         });
         handles.push(handle);
     }
     
+    let mut latency_vec = Vec::with_capacity(total_requests);
     for handle in handles {
-        handle.join().unwrap();
+        latency_vec.extend(handle.join().unwrap());
     }
     
     let total_time = start_time.elapsed();
     let success_count = success_count.load(Ordering::Relaxed);
     let error_count = error_count.load(Ordering::Relaxed);
     
-    let latency_vec = latencies.lock().unwrap();
     let (min_latency, max_latency, avg_latency) = if !latency_vec.is_empty() {
         let min = *latency_vec.iter().min().unwrap();
         let max = *latency_vec.iter().max().unwrap();
@@ -395,13 +405,12 @@ fn run_concurrent_benchmark(config: &BenchConfig, concurrent: usize, expression:
     }
 }
 
-fn make_eval_request(host: &str, port: u16, expression: &str) -> Result<String, std::io::Error> {
+fn build_eval_request(host: &str, expression: &str) -> String {
     let encoded_expr = url_encode(expression);
-    let request = format!(
+    format!(
         "GET /eval?expr={} HTTP/1.1\r\nHost: {}\r\nConnection: close\r\n\r\n",
         encoded_expr, host
-    );
-    make_request(host, port, &request)
+    )
 }
 
 fn make_json_request(host: &str, port: u16, expression: &str, include_variables: &str) -> Result<String, std::io::Error> {
@@ -1,8 +1,9 @@
 use skillet::{evaluate_with_custom, evaluate_with_assignments, Value, JSPluginLoader};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
-use std::net::{TcpListener, TcpStream};
-use std::io::{BufRead, BufReader, Write};
+use std::net::TcpListener;
+use std::io::{BufRead, BufReader, Read, Write};
+use std::os::unix::net::UnixListener;
 use std::sync::{Arc, atomic::{AtomicU64, AtomicBool, Ordering}};
 use std::time::Instant;
 
@@ -55,14 +56,15 @@ impl ServerStats {
     }
 }
 
-fn handle_client(
-    mut stream: TcpStream,
+/// Serves newline-delimited requests from one connection (TCP or Unix socket)
+/// until the client disconnects
+fn handle_client<S: Read + Write>(
+    mut stream: S,
+    reader: BufReader<S>,
     stats: Arc<ServerStats>,
     request_counter: Arc<AtomicU64>,
     server_token: Arc<Option<String>>,
 ) {
-    let reader = BufReader::new(stream.try_clone().unwrap());
-    
     for line in reader.lines() {
         let line = match line {
             Ok(line) => line,
@@ -107,11 +109,15 @@ fn handle_client(
         let execution_time = start_time.elapsed();
         stats.record_request(execution_time.as_micros() as u64);
         
-        let response_json = serde_json::to_string(&response).unwrap_or_else(|_| {
-            format!(r#"{{"success":false,"error":"Failed to serialize response","request_id":{}}}"#, request_id)
+        let mut response_json = serde_json::to_vec(&response).unwrap_or_else(|_| {
+            format!(r#"{{"success":false,"error":"Failed to serialize response","request_id":{}}}"#, request_id).into_bytes()
         });
+        response_json.push(b'\n');
         
-        if let Err(_) = writeln!(stream, "{}", response_json) {
+        // Send the whole line in one write: writing the newline separately
+        // leaves a tiny trailing segment that Nagle holds until the client's
+        // delayed ACK, stalling every response on a kept-alive connection
+        if let Err(_) = stream.write_all(&response_json) {
             break;
         }
         
@@ -240,6 +246,29 @@ fn process_request(req: EvalRequest, request_id: u64) -> EvalResponse {
     }
 }
 
+/// Removes a Unix socket file left behind by a server that is no longer
+/// running. Refuses to touch anything that is not a socket, or a socket that
+/// still accepts connections (another sk_server is using it).
+fn remove_stale_socket(path: &str) -> Result<(), String> {
+    use std::os::unix::fs::FileTypeExt;
+    use std::os::unix::net::UnixStream;
+    
+    let metadata = match std::fs::symlink_metadata(path) {
+        Ok(metadata) => metadata,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(()),
+        Err(e) => return Err(format!("Cannot access socket path {}: {}", path, e)),
+    };
+    
+    if !metadata.file_type().is_socket() {
+        return Err(format!("{} exists and is not a socket", path));
+    }
+    if UnixStream::connect(path).is_ok() {
+        return Err(format!("Socket {} is in use by another server", path));
+    }
+    std::fs::remove_file(path)
+        .map_err(|e| format!("Failed to remove stale socket {}: {}", path, e))
+}
+
 fn daemonize() -> Result<(), Box<dyn std::error::Error>> {
     use std::fs::OpenOptions;
     use std::os::unix::io::AsRawFd;
@@ -330,6 +359,7 @@ fn main() {
         eprintln!("Options:");
         eprintln!("  -d, --daemon         Run as daemon (background process)");
         eprintln!("  -H, --host <addr>    Bind host/interface (default: 127.0.0.1)");
+        eprintln!("  --socket <path>      Also listen on a Unix domain socket (e.g. /tmp/sk_server.sock)");
         eprintln!("  --pid-file <file>    Write PID to file (default: skillet-server.pid)");
         eprintln!("  --log-file <file>    Write logs to file (daemon mode only)");
         eprintln!("  --token <value>      Require token for requests (or set SKILLET_AUTH_TOKEN)");
@@ -339,6 +369,7 @@ fn main() {
         eprintln!("  sk_server 8080 16           # Start with 16 worker threads");
         eprintln!("  sk_server 8080 8 -d         # Run as daemon with 8 threads");
         eprintln!("  sk_server 8080 --host 0.0.0.0   # Expose on all interfaces");
+        eprintln!("  sk_server 8080 --socket /tmp/sk_server.sock   # Faster same-host clients");
         eprintln!("  sk_server 8080 --host 0.0.0.0 --token <secret>");
         eprintln!("  sk_server 8080 -d --pid-file /var/run/skillet.pid");
         eprintln!("");
@@ -356,6 +387,7 @@ fn main() {
     let mut num_threads: usize = num_cpus::get();
     let mut bind_host: String = std::env::var("SKILLET_BIND_HOST").unwrap_or_else(|_| "127.0.0.1".to_string());
     let mut auth_token: Option<String> = std::env::var("SKILLET_AUTH_TOKEN").ok();
+    let mut socket_path: Option<String> = std::env::var("SKILLET_SOCKET_PATH").ok();
     let mut daemon_mode = false;
     let mut pid_file = "skillet-server.pid".to_string();
     let mut _log_file: Option<String> = None;
@@ -375,6 +407,15 @@ fn main() {
                     std::process::exit(1);
                 }
             }
+            "--socket" => {
+                if i + 1 < args.len() {
+                    socket_path = Some(args[i + 1].clone());
+                    i += 1;
+                } else {
+                    eprintln!("Error: --socket requires a path (e.g. /tmp/sk_server.sock)");
+                    std::process::exit(1);
+                }
+            }
             "--pid-file" => {
                 if i + 1 < args.len() {
                     pid_file = args[i + 1].clone();
@@ -475,11 +516,31 @@ fn main() {
             std::process::exit(1);
         });
     
+    // Optional Unix domain socket for same-host clients: skips the TCP/IP
+    // loopback path entirely. A stale socket file from a previous run is
+    // replaced.
+    let unix_listener = socket_path.as_ref().map(|path| {
+        if let Err(e) = remove_stale_socket(path) {
+            eprintln!("Error: {}", e);
+            std::process::exit(1);
+        }
+        let unix_listener = UnixListener::bind(path).unwrap_or_else(|e| {
+            eprintln!("Error: Failed to bind Unix socket {}: {}", path, e);
+            std::process::exit(1);
+        });
+        unix_listener.set_nonblocking(true).unwrap_or_else(|e| {
+            eprintln!("Error: Failed to set non-blocking mode: {}", e);
+            std::process::exit(1);
+        });
+        unix_listener
+    });
+    
     let stats = Arc::new(ServerStats::new());
     let request_counter = Arc::new(AtomicU64::new(0));
     
     if !daemon_mode {
         eprintln!("🚀 Skillet Server started on {}:{}", bind_host, port);
+        if let Some(path) = &socket_path { eprintln!("🔌 Unix socket: {}", path); }
         eprintln!("📊 Worker threads: {}", num_threads);
         if auth_token.is_some() { eprintln!("🔒 Token auth: enabled"); }
         eprintln!("🔧 Ready for high-throughput expression evaluation");
@@ -492,29 +553,64 @@ fn main() {
     // Accept loop that can be interrupted by Ctrl+C
     let server_token = Arc::new(auth_token);
     while running.load(Ordering::Relaxed) {
+        let mut idle = true;
+        
         match listener.accept() {
             Ok((stream, _addr)) => {
+                idle = false;
                 let stats = Arc::clone(&stats);
                 let request_counter = Arc::clone(&request_counter);
                 let server_token = Arc::clone(&server_token);
                 pool.execute(move || {
-                    handle_client(stream, stats, request_counter, server_token);
+                    // Accepted sockets inherit O_NONBLOCK from the listener on macOS/BSD.
+                    let _ = stream.set_nonblocking(false);
+                    let _ = stream.set_nodelay(true);
+                    if let Ok(read_half) = stream.try_clone() {
+                        handle_client(stream, BufReader::new(read_half), stats, request_counter, server_token);
+                    }
                 });
             }
-            Err(ref e) if e.kind() == std::io::ErrorKind::WouldBlock => {
-                // No pending connections; sleep briefly and check again
-                // Keep this very small to avoid per-connection latency
-                std::thread::sleep(std::time::Duration::from_millis(1));
-            }
+            Err(ref e) if e.kind() == std::io::ErrorKind::WouldBlock => {}
             Err(e) => {
                 eprintln!("Error accepting connection: {}", e);
                 // Back off briefly on accept errors, but keep it tight
                 std::thread::sleep(std::time::Duration::from_millis(10));
             }
         }
+        
+        if let Some(unix_listener) = &unix_listener {
+            match unix_listener.accept() {
+                Ok((stream, _addr)) => {
+                    idle = false;
+                    let stats = Arc::clone(&stats);
+                    let request_counter = Arc::clone(&request_counter);
+                    let server_token = Arc::clone(&server_token);
+                    pool.execute(move || {
+                        let _ = stream.set_nonblocking(false);
+                        if let Ok(read_half) = stream.try_clone() {
+                            handle_client(stream, BufReader::new(read_half), stats, request_counter, server_token);
+                        }
+                    });
+                }
+                Err(ref e) if e.kind() == std::io::ErrorKind::WouldBlock => {}
+                Err(e) => {
+                    eprintln!("Error accepting Unix socket connection: {}", e);
+                    std::thread::sleep(std::time::Duration::from_millis(10));
+                }
+            }
+        }
+        
+        if idle {
+            // No pending connections; sleep briefly and check again
+            // Keep this very small to avoid per-connection latency
+            std::thread::sleep(std::time::Duration::from_millis(1));
+        }
     }
 
     // Wait for outstanding tasks to complete
     pool.join();
+    if let Some(path) = &socket_path {
+        let _ = std::fs::remove_file(path);
+    }
     eprintln!("Server shutdown complete.");
 }
@@ -3,6 +3,12 @@
 import requests
 import sys
 import os
+from requests.adapters import HTTPAdapter
+
+# Shared session for all requests. sk_http_server answers with
+# Connection: close, so sockets are not reused until it supports keep-alive
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(max_retries=0))
 
 def test_json_upload():
     """Test JS upload using JSON payload"""
@@ -28,7 +34,7 @@ function execute(args) {
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             url,
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -81,7 +87,7 @@ function execute(args) {
             'filename': 'test_multiply.js'
         }
         
-        response = requests.post(
+        response = SESSION.post(
             url,
             files=files,
             data=data,
@@ -135,7 +141,7 @@ function execute(args) {
     }
     
     try:
-        response = requests.put(
+        response = SESSION.put(
             url,
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -161,7 +167,7 @@ def test_list_functions():
     url = "http://127.0.0.1:5074/list-js"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         
         if response.status_code == 200:
             result = response.json()
@@ -3,6 +3,17 @@
 import requests
 import json
 import sys
+import time
+from itertools import chain
+from requests.adapters import HTTPAdapter
+
+# Shared session for all requests. sk_http_server answers with
+# Connection: close, so sockets are not reused until it supports keep-alive
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(max_retries=0))
+
+# (connect, read) timeouts, so a refused connection is told apart from a slow response
+TIMEOUT = (5, 30)
 
 def test_large_request():
     """Test server with progressively larger requests to identify limits"""
@@ -31,30 +42,33 @@ def test_large_request():
         assignments_per_line = 50
         lines_needed = max(1, size_bytes // (assignments_per_line * 10))  # Rough estimate
         
-        # Generate large expression
-        expression_parts = []
-        for i in range(lines_needed):
-            line = "; ".join([f":var{j+i*assignments_per_line}:={j+i*assignments_per_line}" 
-                             for j in range(assignments_per_line)])
-            expression_parts.append(line)
-        
-        large_expression = "; ".join(expression_parts) + "; :result := :var0 + :var1"
+        # Generate large expression in a single join over all assignments;
+        # the final statement is part of the join so the multi-MB string is
+        # not copied again by a trailing concatenation
+        assignment = ":var{0}:={0}".format
+        total_assignments = lines_needed * assignments_per_line
+        large_expression = "; ".join(chain(
+            map(assignment, range(total_assignments)),
+            (":result := :var0 + :var1",),
+        ))
         
         payload = {
             "expression": large_expression,
             "include_variables": True
         }
         
-        payload_json = json.dumps(payload)
-        actual_size = len(payload_json.encode('utf-8'))
+        # Serialize once; the same bytes give the size and are posted as-is
+        # (json=payload would serialize the multi-MB expression a second time)
+        body = json.dumps(payload).encode('utf-8')
+        actual_size = len(body)
         
         print(f"  📏 Actual payload size: {actual_size:,} bytes")
         
         try:
-            response = requests.post(
+            response = SESSION.post(
                 base_url, 
-                json=payload,
-                timeout=30,
+                data=body,
+                timeout=TIMEOUT,
                 headers={"Content-Type": "application/json"}
             )
             
@@ -68,18 +82,20 @@ def test_large_request():
                 print(f"  ❌ HTTP ERROR - Status: {response.status_code}")
                 print(f"  📄 Response: {response.text[:200]}...")
                 
+        except requests.exceptions.ConnectTimeout:
+            print(f"  🔌 CONNECT TIMEOUT - Could not connect within {TIMEOUT[0]}s")
         except requests.exceptions.ConnectionError as e:
             print(f"  🔌 CONNECTION ERROR - {e}")
             print(f"     This indicates 'Connection reset by peer'")
         except requests.exceptions.Timeout:
-            print(f"  ⏱️  TIMEOUT - Request took longer than 30s")
+            print(f"  ⏱️  TIMEOUT - Request took longer than {TIMEOUT[1]}s")
         except requests.exceptions.RequestException as e:
             print(f"  ❌ REQUEST ERROR - {e}")
         except Exception as e:
             print(f"  💥 UNEXPECTED ERROR - {e}")
             
-        # Add a small delay between tests
-        import time
+        # Add a small delay between tests; an oversized payload can make the
+        # server drop the connection, so give it a moment before the next probe
         time.sleep(0.5)
 
 if __name__ == "__main__":